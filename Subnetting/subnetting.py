@@ -1,16 +1,28 @@
-import math
+import socket
+import struct
+import sys
+from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
 
+# Stop listing subnets after this many rows
+MAX_DISPLAYED_SUBNETS = 10_000
 
-# ==================== USER INPUT ====================
-# Ask user for IP and subnet mask
-input_ipv4_address = input("Enter IPv4 Address (e.g. 10.10.10.10): ")
+# Lookup tables for every possible octet value (0-255)
+# BIN8[octet] → 8-bit binary string, DEC3[octet] → decimal string
+BIN8 = tuple(format(i, '08b') for i in range(256))
+DEC3 = tuple(str(i) for i in range(256))
 
-try:
-    original_mask = int(input("Enter the original subnet mask (0-32): /"))
-    number_of_subnets = int(input("Enter the number of desired subnets: "))
-except ValueError:
-    print("Enter a valid number for the subnet mask.")
-    exit(1)  # Stop execution if invalid
+# One row per subnet (tuple storage, no per-row dict)
+Subnet = namedtuple('Subnet', 'subnet_index network broadcast first_host last_host')
+
+# One block of output per subnet
+SUBNET_ROW_TEMPLATE = (
+    "Subnet #{subnet_index} => Network: {network}/{new_mask}\n"
+    "  Broadcast: {broadcast}\n"
+    "  First Host: {first_host}   Last Host: {last_host}\n"
+    "-------------------------------------------------------------\n"
+)
 
 
 # ==================== SUBNET MASK CALCULATION ====================
@@ -26,17 +38,19 @@ def calculate_new_subnet_mask_for_subnets(base_mask, desired_subnets):
         raise ValueError("Number of subnets must be positive.")
     
     # Calculate: 2^bits_to_borrow >= desired_subnets
-    # Round up to the nearest integer
-    bits_to_borrow = math.ceil(math.log2(desired_subnets))
+    # (desired_subnets - 1).bit_length() is the smallest such power, exactly,
+    # using integer math only (log2 loses precision for huge inputs)
+    bits_to_borrow = (desired_subnets - 1).bit_length()
     new_mask = base_mask + bits_to_borrow
-    
+
+    # Reject before anything is enumerated
     if new_mask > 32:
         raise ValueError(
             f"Cannot create {desired_subnets} subnets from /{base_mask} because /{new_mask} is > /32."
         )
     
     # Calculate total subnets
-    total_subnets = 2 ** bits_to_borrow
+    total_subnets = 1 << bits_to_borrow
 
     return new_mask, total_subnets, bits_to_borrow
 
@@ -45,96 +59,69 @@ def calculate_new_subnet_mask_for_subnets(base_mask, desired_subnets):
 def get_ip_address(ip_string):
     """
     Validate the IP string.
-    Return: dotted_decimal, binary.
+    Return: the IP address as a 32-bit integer.
     """
-    # Clean whitespace and split by '.'
-    parts = ip_string.strip().split('.')
-
-    # Validate the number of octets
-    if len(parts) != 4:
-        raise ValueError("The IPv4 address must have exactly four octets.")
-    
-    octets_decimal = []
-    octets_binary = []
-
-    for part in parts:
-        # Check if part is a number
-        if not part.isdigit():
-            raise ValueError(f"Octet '{part}' is not a valid number.")
-        # Check if part is in the range 0-255
-        octet_value = int(part)
-        if octet_value < 0 or octet_value > 255:
-            raise ValueError(f"Octet '{part}' is outside 0-255 range.")
-        
-        # Append to the lists as string for later joining
-        octets_decimal.append(str(octet_value))
-        octets_binary.append(format(octet_value, '08b'))
+    # inet_pton only accepts four decimal octets in the 0-255 range
+    # and packs them into 4 bytes in network (big-endian) order
+    try:
+        packed_ip = socket.inet_pton(socket.AF_INET, ip_string.strip())
+    except OSError:
+        raise ValueError(
+            f"'{ip_string.strip()}' is not a valid IPv4 address (expected four octets in 0-255)."
+        ) from None
 
-    # Join the octets to form the dotted-decimal and binary representations
-    dotted_decimal_ip = '.'.join(octets_decimal)
-    binary_format_ip = '.'.join(octets_binary)
-    return dotted_decimal_ip, binary_format_ip
+    # '!I' unpacks the 4 bytes as one unsigned 32-bit integer
+    return struct.unpack('!I', packed_ip)[0]
 
 
 # ==================== CIDR TO MASK CONVERSION ====================
-def cidr_to_subnet_mask(cidr_int):
+def cidr_to_mask_int(cidr_int):
     """
-    Convert CIDR to:
-        - dotted-decimal format (e.g., 255.255.255.0)
-        - binary format (e.g., 11111111.11111111.11111111.00000000)
+    Convert CIDR to the subnet mask as a 32-bit integer.
+    Example: 24 → 0xFFFFFF00
     """
     # Check if CIDR is valid
     if not (0 <= cidr_int <= 32):
         raise ValueError("CIDR must be in [0..32].")
-    
-    # Create binary mask
+
     # 1s for the network part, 0s for the host part
-    # e.g., /24 => 11111111.11111111.11111111.00000000
-    binary_mask = '1' * cidr_int + '0' * (32 - cidr_int)
+    # Shift 32 ones left by the host bits and drop anything above bit 31
+    # /0 has no network bits, so the mask is 0
+    return (0xFFFFFFFF << (32 - cidr_int)) & 0xFFFFFFFF if cidr_int else 0
 
-    # Split into 4 octets of 8 bits each
-    # Convert each octet from binary to decimal
-    octets_binary = [binary_mask[i:i+8] for i in range(0, 32, 8)]
-    octets_decimal = [str(int(bit, 2)) for bit in octets_binary]
+
+@lru_cache(maxsize=33)
+def cidr_to_subnet_mask(cidr_int):
+    """
+    Convert CIDR to:
+        - dotted-decimal format (e.g., 255.255.255.0)
+        - binary format (e.g., 11111111.11111111.11111111.00000000)
+    """
+    mask_int = cidr_to_mask_int(cidr_int)
+
+    # Extract the 4 octets, most significant first
+    octets = [(mask_int >> shift) & 0xFF for shift in (24, 16, 8, 0)]
 
     # Join the octets to form the dotted-decimal and binary representations
-    dotted_decimal_mask = '.'.join(octets_decimal)
-    binary_format_mask = '.'.join(octets_binary)
+    dotted_decimal_mask = '.'.join([DEC3[octet] for octet in octets])
+    binary_format_mask = '.'.join([BIN8[octet] for octet in octets])
 
     return dotted_decimal_mask, binary_format_mask
 
 
 # ==================== NETWORK ADDRESS ====================
-def get_network_address(ip_binary, mask_binary):
+def get_network_address(ip_int, mask_int):
     """
-    Performs a bitwise AND between the binary IP and subnet mask.
+    Performs a bitwise AND between the IP and subnet mask integers.
     Returns:
-        - network address in dotted-decimal and binary format
+        - network address as a 32-bit integer
     """
-    # Remove dots to get raw binary strings
-    ip_raw = ip_binary.replace('.', '')
-    mask_raw = mask_binary.replace('.', '')
-
-    # Convert binary strings to integers (base 2)
-    ip_int = int(ip_raw, 2)
-    mask_int = int(mask_raw, 2)
-
-    # Perform bitwise AND to get the network address
-    network_int = ip_int & mask_int
-    network_binary = format(network_int, '032b')
-
-    # Split the binary string into 4 octets of 8 bits each
-    network_octets_binary = [network_binary[i:i+8] for i in range(0, 32, 8)]
-    network_octets_decimal = [str(int(octet, 2)) for octet in network_octets_binary]
-
-    # Join the octets to form the dotted-decimal and binary representations
-    network_binary_format = '.'.join(network_octets_binary)
-    network_dotted_format = '.'.join(network_octets_decimal)
-
-    return network_dotted_format, network_binary_format
+    # Host bits are cleared, network bits are kept
+    return ip_int & mask_int
 
 
 # ==================== HOST CALCULATION ====================
+@lru_cache(maxsize=33)
 def calculate_possible_hosts(cidr_int):
     """
     Returns number of usable hosts based on CIDR mask.
@@ -158,165 +145,184 @@ def int_to_dotted(ip_int):
     Takes an integer and converts it to a string in the format "x.x.x.x".
     Example: 3232235777 → "192.168.1.1"
     """
-    # List to hold the 4 octets
-    octets = []
-
-    # Extract each of the 4 bytes from the integer
-    #We go from left to right (most significant byte to least), meaning:
-        # i = 3 → first byte (bits 24–31)
-        # i = 2 → second byte (bits 16–23)
-        # i = 1 → third byte (bits 8–15)
-        # i = 0 → fourth byte (bits 0–7)
-    # Each octet is 8 bits, so we shift right by 8 * i bits
-    # and mask with 0xFF to get the last 8 bits
-    # The loop goes from 3 to 0 (4 octets)
-    # 0xFF is 255 in decimal, which is the max value for an octet
-    for i in range(3, -1, -1):                      # i = 3, 2, 1, 0
-        shift_amount = 8 * i                        # Calculate how many bits to shift
-        octet = (ip_int >> shift_amount) & 0xFF     # >>: Shifts the bits to the right
-        octets.append(str(octet))                   # Convert to string
-
-    # Join the 4 octet strings into a dotted IP address
-    dotted_ip = '.'.join(octets)
-    return dotted_ip
+    # to_bytes packs the integer into 4 bytes, most significant first
+    # (network byte order), and inet_ntoa formats those bytes as "x.x.x.x"
+    return socket.inet_ntoa(ip_int.to_bytes(4, 'big'))
+
+
+# ==================== CONVERT INT TO BINARY IP ====================
+def int_to_binary(ip_int):
+    """
+    Converts a 32-bit integer to a dotted binary IPv4 address.
+    Example: 3232235777 → "11000000.10101000.00000001.00000001"
+    """
+    # Shift each octet down and mask with 0xFF, then look up its 8 bits
+    return '.'.join([BIN8[(ip_int >> shift) & 0xFF] for shift in (24, 16, 8, 0)])
 
 
 # ==================== ENUMERATE SUBNET RANGES ====================
-def get_subnet_ranges(base_network_int, new_mask, total_subnets):
+def get_subnet_columns(base_network_int, new_mask, total_subnets):
     """
-    Enumerate each of the sub-subnets under the new_mask.
-    Return a List of dicts containing: 
-            - network
-            - broadcast
-            - first_host
-            - last_host
+    Compute every subnet's addresses as four parallel integer columns.
+    Return: network_ints, broadcast_ints, first_host_ints, last_host_ints.
     """
     # Each subnet's size in IP addresses (including network & broadcast):
     # The size of each subnet is 2^(32 - new_mask)
-    subnet_size = 2 ** (32 - new_mask)
-    
-    # Placeholder for subnet information
-    # Each subnet will be a dictionary with its details
-    subnets_info = []
-
-    # Loop through the number of subnets
-    # Each subnet is an increment of the base network address
-    # by the size of the subnet
-    for i in range(total_subnets):
-        # Calculate this subnet's network address (integer)
-        subnet_network_int = base_network_int + (i * subnet_size)
-        # Broadcast address is one less than the next subnet's network
-        # or (subnet_network_int + subnet_size - 1)
-        subnet_broadcast_int = subnet_network_int + subnet_size - 1
-
-        # Convert them to dotted
-        subnet_network_dotted = int_to_dotted(subnet_network_int)
-        subnet_broadcast_dotted = int_to_dotted(subnet_broadcast_int)
-
-        # Calculate first/last host
-        if new_mask >= 31:
-            first_host = "N/A"
-            last_host = "N/A"
-        else:
-            first_host = int_to_dotted(subnet_network_int + 1)
-            last_host = int_to_dotted(subnet_broadcast_int - 1)
-
-        sub_dict = {
-            "subnet_index": i + 1,
-            "network": subnet_network_dotted,
-            "broadcast": subnet_broadcast_dotted,
-            "first_host": first_host,
-            "last_host": last_host
-        }
-        subnets_info.append(sub_dict)
-
-    return subnets_info
+    subnet_size = 1 << (32 - new_mask)
+    span = total_subnets * subnet_size
+
+    # Each column starts at its offset within the first subnet and steps
+    # by subnet_size, so all four have exactly total_subnets entries
+    # Ranges hold only start/stop/step, so memory stays constant
+    # no matter how many subnets there are
+    # Broadcast address is one less than the next subnet's network
+    # First/last hosts sit right inside the network/broadcast addresses
+    # (for /31 and /32 they fall outside the subnet and are not shown)
+    network_start = base_network_int
+    broadcast_start = base_network_int + subnet_size - 1
+    network_ints = range(network_start, network_start + span, subnet_size)
+    broadcast_ints = range(broadcast_start, broadcast_start + span, subnet_size)
+    first_host_ints = range(network_start + 1, network_start + 1 + span, subnet_size)
+    last_host_ints = range(broadcast_start - 1, broadcast_start - 1 + span, subnet_size)
+
+    return network_ints, broadcast_ints, first_host_ints, last_host_ints
+
+
+def iter_subnet_ranges(base_network_int, new_mask, total_subnets):
+    """
+    Lazily enumerate each of the sub-subnets under the new_mask.
+    Yield one Subnet of integers per subnet containing:
+            - subnet_index
+            - network
+            - broadcast
+            - first_host (None for /31 and /32)
+            - last_host (None for /31 and /32)
+    """
+    network_ints, broadcast_ints, first_host_ints, last_host_ints = get_subnet_columns(
+        base_network_int, new_mask, total_subnets
+    )
 
+    # /31 and /32 have no first/last host, so decide that once up front
+    # instead of re-testing the mask for every subnet
+    if new_mask >= 31:
+        for i, (network_int, broadcast_int) in enumerate(zip(network_ints, broadcast_ints), start=1):
+            yield Subnet(i, network_int, broadcast_int, None, None)
+        return
 
-# ==================== BROADCAST ADDRESS ====================
-def get_broadcast_address(ip_binary, mask_binary):
+    for i, columns in enumerate(zip(network_ints, broadcast_ints, first_host_ints, last_host_ints), start=1):
+        yield Subnet(i, *columns)
+
+
+# ==================== FORMAT SUBNET ====================
+def format_subnet(subnet, new_mask):
     """
-    broadcast = IP | (~mask)
-    Return: broadcast_binary, broadcast_dotted.
+    Convert one integer Subnet to its printable block of text.
+    Addresses are only turned into dotted strings here, at display time.
     """
-    # Remove dots to get raw binary strings
-    ip_raw = ip_binary.replace('.', '')
-    mask_raw = mask_binary.replace('.', '')
+    # /31 and /32 subnets have no usable first/last host
+    if subnet.first_host is None:
+        first_host = last_host = "N/A"
+    else:
+        first_host = int_to_dotted(subnet.first_host)
+        last_host = int_to_dotted(subnet.last_host)
 
-    # Convert binary strings to integers (base 2)
-    ip_int = int(ip_raw, 2)
-    mask_int = int(mask_raw, 2)
+    return SUBNET_ROW_TEMPLATE.format(
+        subnet_index=subnet.subnet_index,
+        network=int_to_dotted(subnet.network),
+        new_mask=new_mask,
+        broadcast=int_to_dotted(subnet.broadcast),
+        first_host=first_host,
+        last_host=last_host
+    )
 
-    # Perform bitwise NOT on the mask and then OR with the IP
-    # ~mask gives us the inverted mask
-    # ~mask is a bitwise NOT operation, which flips all bits
-    inverted_mask = ~mask_int & 0xFFFFFFFF
-    broadcast_int = ip_int | inverted_mask
 
-    # Convert the broadcast address back to binary
-    # Format the integer as a 32-bit binary string
-    # '032b' means 32 bits, padded with zeros if necessary
-    broadcast_binary = format(broadcast_int, '032b')
-    broadcast_octets_binary = [broadcast_binary[i:i+8] for i in range(0, 32, 8)]
-    broadcast_octets_decimal = [str(int(octet, 2)) for octet in broadcast_octets_binary]
-
-    # Join the octets to form the dotted-decimal and binary representations
-    broadcast_binary_format = '.'.join(broadcast_octets_binary)
-    broadcast_dotted_format = '.'.join(broadcast_octets_decimal)
-    return broadcast_binary_format, broadcast_dotted_format
+# ==================== BROADCAST ADDRESS ====================
+def get_broadcast_address(ip_int, mask_int):
+    """
+    broadcast = IP | (~mask)
+    Return: broadcast address as a 32-bit integer.
+    """
+    # ~mask is a bitwise NOT operation, which flips all bits
+    # & 0xFFFFFFFF keeps the result within 32 bits
+    return ip_int | (~mask_int & 0xFFFFFFFF)
 
 
 # ==================== MAIN EXECUTION ====================
-# 1) Calculate the new mask and total subnets
-
-try:
-    # Validate the original mask
-    new_mask, total_subnets, bits_borrowed = calculate_new_subnet_mask_for_subnets(original_mask, number_of_subnets)
-except ValueError as e:
-    print("Error:", e)
-    exit(1)
-
-# 2) Convert user IP to dotted & binary
-try:
-    dotted_decimal_ip, binary_format_ip = get_ip_address(input_ipv4_address)
-except ValueError as e:
-    print("Error:", e)
-    exit(1)
-
-# 3) Convert original_mask to dotted/binary 
-# We want the *original* mask to find the base network.
-orig_mask_dotted, orig_mask_binary = cidr_to_subnet_mask(original_mask)
-
-# 4) Base Network Address with *original* mask
-base_network_dotted, base_network_binary = get_network_address(binary_format_ip, orig_mask_binary)
-
-# 5) Convert base_network_address to integer
-base_network_int = int(base_network_binary.replace('.', ''), 2)
-
-# 6) Summarize new_mask info
-new_mask_dotted, new_mask_binary = cidr_to_subnet_mask(new_mask)
-hosts_per_subnet = calculate_possible_hosts(new_mask)
-
-# 7) Enumerate each new subnet
-all_subnets = get_subnet_ranges(base_network_int, new_mask, total_subnets)
-
-
-# ==================== OUTPUT RESULTS ====================
-print("\n========================== RESULTS ==========================")
-print(f"Original IP:                {dotted_decimal_ip}")
-print(f"Original CIDR:              /{original_mask} ({orig_mask_dotted})")
-print(f"Base Network (Dotted):      {base_network_dotted}")
-print(f"Base Network (Binary):      {base_network_binary}")
-print(f"\nDesired Subnets:            {number_of_subnets}")
-print(f"New Mask (CIDR):            /{new_mask} ({new_mask_dotted})")
-print(f"Bits Borrowed:              {bits_borrowed}")
-print(f"Total Subnets Created:      {total_subnets}")
-print(f"Hosts per Subnet:           {hosts_per_subnet}  (with /{new_mask})")
-print("=============================================================\n")
-
-print("------- Subnet Ranges -------")
-for subnet in all_subnets:
-    print(f"Subnet #{subnet['subnet_index']} => Network: {subnet['network']}/{new_mask}")
-    print(f"  Broadcast: {subnet['broadcast']}")
-    print(f"  First Host: {subnet['first_host']}   Last Host: {subnet['last_host']}")
-    print("-------------------------------------------------------------")
+def main():
+    """
+    Prompt for the IP, mask and number of subnets, then print the results.
+    """
+    # ==================== USER INPUT ====================
+    # Ask user for IP and subnet mask
+    input_ipv4_address = input("Enter IPv4 Address (e.g. 10.10.10.10): ")
+
+    try:
+        original_mask = int(input("Enter the original subnet mask (0-32): /"))
+        number_of_subnets = int(input("Enter the number of desired subnets: "))
+    except ValueError:
+        print("Enter a valid number for the subnet mask.")
+        exit(1)  # Stop execution if invalid
+
+    # 1) Calculate the new mask and total subnets
+    try:
+        # Validate the original mask
+        new_mask, total_subnets, bits_borrowed = calculate_new_subnet_mask_for_subnets(original_mask, number_of_subnets)
+    except ValueError as e:
+        print("Error:", e)
+        exit(1)
+
+    # 2) Convert user IP to integer
+    try:
+        ip_int = get_ip_address(input_ipv4_address)
+    except ValueError as e:
+        print("Error:", e)
+        exit(1)
+
+    # 3) Convert original_mask to dotted and integer
+    # We want the *original* mask to find the base network.
+    orig_mask_dotted, _ = cidr_to_subnet_mask(original_mask)
+    orig_mask_int = cidr_to_mask_int(original_mask)
+
+    # 4) Dotted form of the user IP for display
+    dotted_decimal_ip = int_to_dotted(ip_int)
+
+    # 5) Base Network Address with *original* mask
+    base_network_int = get_network_address(ip_int, orig_mask_int)
+    base_network_dotted = int_to_dotted(base_network_int)
+    base_network_binary = int_to_binary(base_network_int)
+
+    # 6) Summarize new_mask info
+    new_mask_dotted, new_mask_binary = cidr_to_subnet_mask(new_mask)
+    hosts_per_subnet = calculate_possible_hosts(new_mask)
+
+    # 7) Enumerate each new subnet (lazily, only as many as will be shown)
+    all_subnets = iter_subnet_ranges(base_network_int, new_mask, total_subnets)
+
+    # ==================== OUTPUT RESULTS ====================
+    print("\n========================== RESULTS ==========================")
+    print(f"Original IP:                {dotted_decimal_ip}")
+    print(f"Original CIDR:              /{original_mask} ({orig_mask_dotted})")
+    print(f"Base Network (Dotted):      {base_network_dotted}")
+    print(f"Base Network (Binary):      {base_network_binary}")
+    print(f"\nDesired Subnets:            {number_of_subnets}")
+    print(f"New Mask (CIDR):            /{new_mask} ({new_mask_dotted})")
+    print(f"Bits Borrowed:              {bits_borrowed}")
+    print(f"Total Subnets Created:      {total_subnets}")
+    print(f"Hosts per Subnet:           {hosts_per_subnet}  (with /{new_mask})")
+    print("=============================================================\n")
+
+    print("------- Subnet Ranges -------")
+    # Build every row first and write them out in one call
+    subnet_rows = [
+        format_subnet(subnet, new_mask)
+        for subnet in islice(all_subnets, MAX_DISPLAYED_SUBNETS)
+    ]
+    sys.stdout.write(''.join(subnet_rows))
+
+    # Let the user know the list was cut short
+    if total_subnets > MAX_DISPLAYED_SUBNETS:
+        print(f"... {total_subnets - MAX_DISPLAYED_SUBNETS} more subnets not shown.")
+
+
+if __name__ == "__main__":
+    main()